@@ -1,5 +1,6 @@
 from __future__ import annotations
-import copy
+import random
+from array import array
 from typing import Dict, List, Tuple, Union
 
 try:
@@ -7,6 +8,17 @@ try:
 except ImportError:
     pygame = None
 
+try:
+    from numba import njit # type: ignore
+except ImportError:
+    njit = None
+
+
+def jit(fn):
+    """Compile ``fn`` with Numba when available, otherwise leave it as Python."""
+    return njit(cache=True)(fn) if njit is not None else fn
+
+
 ROWS = COLS = 8
 SQUARE_SIZE = 100
 
@@ -20,7 +32,95 @@ GREY = (128, 128, 128)
 LIGHT = (238, 238, 210)
 DARK = (118, 150, 86)
 
+# Only the 32 dark squares are playable. Square i is SQUARES[i] = (row, col), numbered
+# row by row (4 per row) so row 0 is the low nibble; SQUARE_INDEX maps back, -1 on light squares.
+NUM_SQUARES = ROWS * COLS // 2
+SQUARES = [(r, c) for r in range(ROWS) for c in range(COLS) if (r + c) % 2 == 1]
+SQUARE_INDEX = [[-1] * COLS for _ in range(ROWS)]
+for _i, (_r, _c) in enumerate(SQUARES):
+    SQUARE_INDEX[_r][_c] = _i
+
+ALL_SQUARES = (1 << NUM_SQUARES) - 1
+EVEN_ROWS = sum(1 << i for i, (r, _) in enumerate(SQUARES) if r % 2 == 0)
+ODD_ROWS = ALL_SQUARES & ~EVEN_ROWS
+# Even rows hold cols 1,3,5,7 and odd rows cols 0,2,4,6, so stepping a diagonal is a
+# shift of 4 plus 3 or 5 depending on row parity; these exclude the edge files.
+EVEN_NOT_RIGHT = sum(1 << i for i, (r, c) in enumerate(SQUARES) if r % 2 == 0 and c != COLS - 1)
+ODD_NOT_LEFT = sum(1 << i for i, (r, c) in enumerate(SQUARES) if r % 2 == 1 and c != 0)
+RED_KING_ROW = sum(1 << i for i, (r, _) in enumerate(SQUARES) if r == ROWS - 1)
+WHITE_KING_ROW = sum(1 << i for i, (r, _) in enumerate(SQUARES) if r == 0)
+
+# Diagonal directions as (row step, col step). The first two move towards higher
+# rows (RED's forward direction), the last two towards lower rows (WHITE's).
+DIRECTIONS = ((1, -1), (1, 1), (-1, -1), (-1, 1))
+FORWARD = ((0, 1), (2, 3))
+
+
+def _square_table(distance: int) -> List[Tuple[int, ...]]:
+    table = []
+    for row, col in SQUARES:
+        targets = []
+        for dr, dc in DIRECTIONS:
+            r, c = row + dr * distance, col + dc * distance
+            targets.append(SQUARE_INDEX[r][c] if 0 <= r < ROWS and 0 <= c < COLS else -1)
+        table.append(tuple(targets))
+    return table
+
+
+# NEIGHBORS[sq][d] is the square one step along DIRECTIONS[d], JUMPS[sq][d] the
+# landing square two steps along it; -1 when that falls off the board.
+NEIGHBORS = _square_table(1)
+JUMPS = _square_table(2)
+
+
+# Piece-square weights for men, by advancement towards RED's king row. WHITE reads the
+# table rotated 180 degrees; both are flattened to the 32 dark squares.
+POSITION_WEIGHTS = [
+    [0, 1, 0, 1, 0, 1, 0, 1],
+    [1, 0, 2, 0, 2, 0, 1, 0],
+    [0, 2, 0, 3, 0, 2, 0, 1],
+    [2, 0, 3, 0, 3, 0, 2, 0],
+    [0, 3, 0, 4, 0, 3, 0, 2],
+    [3, 0, 4, 0, 4, 0, 3, 0],
+    [0, 5, 0, 6, 0, 5, 0, 4],
+    [7, 0, 7, 0, 7, 0, 7, 0] 
+]
+PSQT_RED = array('b', [POSITION_WEIGHTS[r][c] for r, c in SQUARES])
+PSQT_WHITE = array('b', [POSITION_WEIGHTS[ROWS - 1 - r][COLS - 1 - c] for r, c in SQUARES])
+
+# Zobrist keys per (square, piece kind). Seeded so every process hashes alike.
+RED_MAN, RED_KING, WHITE_MAN, WHITE_KING = range(4)
+_zobrist_rng = random.Random(440)
+ZOBRIST = [[_zobrist_rng.getrandbits(64) for _ in range(4)] for _ in range(NUM_SQUARES)]
+ZOBRIST_RED_TO_MOVE = _zobrist_rng.getrandbits(64)
+
+
+def _can_jump(down: int, up: int, opp: int, empty: int) -> bool:
+    # Jumps: one step onto an opponent, a second step in the same direction onto an empty square.
+    over = ((down & EVEN_ROWS) << 4 | (down & ODD_NOT_LEFT) << 3) & opp
+    if ((over & EVEN_ROWS) << 4 | (over & ODD_NOT_LEFT) << 3) & empty:
+        return True
+    over = ((down & EVEN_NOT_RIGHT) << 5 | (down & ODD_ROWS) << 4) & opp
+    if ((over & EVEN_NOT_RIGHT) << 5 | (over & ODD_ROWS) << 4) & empty:
+        return True
+    over = ((up & EVEN_ROWS) >> 4 | (up & ODD_NOT_LEFT) >> 5) & opp
+    if ((over & EVEN_ROWS) >> 4 | (over & ODD_NOT_LEFT) >> 5) & empty:
+        return True
+    over = ((up & EVEN_NOT_RIGHT) >> 3 | (up & ODD_ROWS) >> 4) & opp
+    if ((over & EVEN_NOT_RIGHT) >> 3 | (over & ODD_ROWS) >> 4) & empty:
+        return True
+    return False
+
+
+def iter_bits(bb: int):
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
 class Piece:
+    __slots__ = ("row", "col", "color", "king")
     PADDING = 15
     OUTLINE = 2
 
@@ -53,56 +153,145 @@ class Piece:
 
 
 class Board:
+    """Checkers position stored as four bitboards.
+
+    ``Piece`` objects are only built on demand (``get_piece``, ``get_all_pieces``,
+    ``get_valid_moves``) so callers keep the same API as the old 8x8 grid.
+    """
+
     def __init__(self):
-        self.board: List[List[Union[Piece, int]]] = []
+        self.red_men_bb = self.red_kings_bb = 0
+        self.white_men_bb = self.white_kings_bb = 0
         self.red_left = self.white_left = 12
         self.red_kings = self.white_kings = 0
+        self.zkey = 0
+        # Running POSITION_WEIGHTS totals over each side's men
+        self.red_psqt = self.white_psqt = 0
+        # winner() result for the current position, ... when not computed yet
+        self._winner_cache = ...
         self._init_board()
 
     def _init_board(self):
-        self.board.clear()
-        for row in range(ROWS):
-            self.board.append([])
-            for col in range(COLS):
-                if (row + col) % 2 == 1:
-                    if row < 3:
-                        self.board[row].append(Piece(row, col, RED))
-                    elif row > 4:
-                        self.board[row].append(Piece(row, col, WHITE))
-                    else:
-                        self.board[row].append(0)
-                else:
-                    self.board[row].append(0)
+        for sq, (row, _) in enumerate(SQUARES):
+            if row < 3:
+                self.red_men_bb |= 1 << sq
+                self.zkey ^= ZOBRIST[sq][RED_MAN]
+                self.red_psqt += PSQT_RED[sq]
+            elif row > 4:
+                self.white_men_bb |= 1 << sq
+                self.zkey ^= ZOBRIST[sq][WHITE_MAN]
+                self.white_psqt += PSQT_WHITE[sq]
 
     def copy(self) -> "Board":
-        return copy.deepcopy(self)
+        # Every field is a plain value, so a shallow attribute copy is a full snapshot.
+        new = Board.__new__(Board)
+        new.__dict__.update(self.__dict__)
+        return new
+
+    def _piece_at(self, sq: int) -> Union[Piece, int]:
+        bit = 1 << sq
+        row, col = SQUARES[sq]
+        if (self.red_men_bb | self.red_kings_bb) & bit:
+            piece = Piece(row, col, RED)
+            piece.king = bool(self.red_kings_bb & bit)
+            return piece
+        if (self.white_men_bb | self.white_kings_bb) & bit:
+            piece = Piece(row, col, WHITE)
+            piece.king = bool(self.white_kings_bb & bit)
+            return piece
+        return 0
 
     def get_piece(self, row: int, col: int) -> Union[Piece, int]:
-        return self.board[row][col]
+        sq = SQUARE_INDEX[row][col]
+        return self._piece_at(sq) if sq >= 0 else 0
 
     def get_all_pieces(self, color: Tuple[int, int, int]) -> List[Piece]:
-        return [p for row in self.board for p in row if p != 0 and p.color == color]
+        if color == RED:
+            men, kings = self.red_men_bb, self.red_kings_bb
+        else:
+            men, kings = self.white_men_bb, self.white_kings_bb
+        pieces = []
+        squares, new_piece, append = SQUARES, Piece, pieces.append
+        for sq in iter_bits(men | kings):
+            row, col = squares[sq]
+            piece = new_piece(row, col, color)
+            piece.king = bool(kings >> sq & 1)
+            append(piece)
+        return pieces
 
     def move(self, piece: Piece, row: int, col: int):
-        self.board[piece.row][piece.col], self.board[row][col] = 0, piece
+        promoted = self.move_square(SQUARE_INDEX[piece.row][piece.col], SQUARE_INDEX[row][col])
         piece.move(row, col)
-        if (row == ROWS - 1 and piece.color == RED) or (row == 0 and piece.color == WHITE):
-            if not piece.king:
-                piece.make_king()
-                if piece.color == RED:
-                    self.red_kings += 1
-                else:
-                    self.white_kings += 1
+        if promoted:
+            piece.make_king()
+
+    def move_square(self, src: int, dst: int) -> bool:
+        """Move the piece on square ``src`` to ``dst``; returns True if it was promoted."""
+        src_bit, dst_bit = 1 << src, 1 << dst
+        self._winner_cache = ...
+        if self.red_kings_bb & src_bit:
+            self.red_kings_bb ^= src_bit | dst_bit
+            kind = new_kind = RED_KING
+        elif self.white_kings_bb & src_bit:
+            self.white_kings_bb ^= src_bit | dst_bit
+            kind = new_kind = WHITE_KING
+        elif self.red_men_bb & src_bit:
+            self.red_men_bb ^= src_bit
+            kind = new_kind = RED_MAN
+            self.red_psqt -= PSQT_RED[src]
+            if dst_bit & RED_KING_ROW:
+                self.red_kings_bb |= dst_bit
+                self.red_kings += 1
+                new_kind = RED_KING
+            else:
+                self.red_men_bb |= dst_bit
+                self.red_psqt += PSQT_RED[dst]
+        else:
+            self.white_men_bb ^= src_bit
+            kind = new_kind = WHITE_MAN
+            self.white_psqt -= PSQT_WHITE[src]
+            if dst_bit & WHITE_KING_ROW:
+                self.white_kings_bb |= dst_bit
+                self.white_kings += 1
+                new_kind = WHITE_KING
+            else:
+                self.white_men_bb |= dst_bit
+                self.white_psqt += PSQT_WHITE[dst]
+        self.zkey ^= ZOBRIST[src][kind] ^ ZOBRIST[dst][new_kind]
+        return kind != new_kind
 
     def remove(self, pieces: List[Piece]):
         for p in pieces:
-            self.board[p.row][p.col] = 0
-            if p.color == RED:
-                self.red_left -= 1
-            else:
-                self.white_left -= 1
+            self.remove_square(SQUARE_INDEX[p.row][p.col])
+
+    def remove_square(self, sq: int):
+        bit = 1 << sq
+        self._winner_cache = ...
+        if self.red_men_bb & bit:
+            self.red_men_bb ^= bit
+            self.red_left -= 1
+            self.zkey ^= ZOBRIST[sq][RED_MAN]
+            self.red_psqt -= PSQT_RED[sq]
+        elif self.red_kings_bb & bit:
+            self.red_kings_bb ^= bit
+            self.red_left -= 1
+            self.zkey ^= ZOBRIST[sq][RED_KING]
+        elif self.white_men_bb & bit:
+            self.white_men_bb ^= bit
+            self.white_left -= 1
+            self.zkey ^= ZOBRIST[sq][WHITE_MAN]
+            self.white_psqt -= PSQT_WHITE[sq]
+        else:
+            self.white_kings_bb ^= bit
+            self.white_left -= 1
+            self.zkey ^= ZOBRIST[sq][WHITE_KING]
 
     def winner(self) -> Union[str, None]:
+        if self._winner_cache is ...:
+            self._winner_cache = self._compute_winner()
+        return self._winner_cache
+
+    def _compute_winner(self) -> Union[str, None]:
         if self.red_left <= 0:
             return "White"
         if self.white_left <= 0:
@@ -116,81 +305,68 @@ class Board:
 
         return None
 
+    def _sides(self, color: Tuple[int, int, int]) -> Tuple[int, int, int, int]:
+        """Pieces moving towards higher rows, towards lower rows, opponents and empty squares."""
+        if color == RED:
+            down, up = self.red_men_bb | self.red_kings_bb, self.red_kings_bb
+            opp = self.white_men_bb | self.white_kings_bb
+        else:
+            down, up = self.white_kings_bb, self.white_men_bb | self.white_kings_bb
+            opp = self.red_men_bb | self.red_kings_bb
+        return down, up, opp, ALL_SQUARES & ~(down | up | opp)
+
     def has_legal_moves(self, color: Tuple[int, int, int]) -> bool:
-        pieces = self.get_all_pieces(color)
-        for piece in pieces:
-            if self.get_valid_moves(piece):
-                return True
-        return False
+        down, up, opp, empty = self._sides(color)
+
+        # Quiet steps towards higher rows are << 4 plus << 5 (even rows) or << 3 (odd rows);
+        # towards lower rows >> 4 plus >> 3 (even rows) or >> 5 (odd rows).
+        if (down << 4 | (down & EVEN_NOT_RIGHT) << 5 | (down & ODD_NOT_LEFT) << 3) & empty:
+            return True
+        if (up >> 4 | (up & EVEN_NOT_RIGHT) >> 3 | (up & ODD_NOT_LEFT) >> 5) & empty:
+            return True
+        return _can_jump(down, up, opp, empty)
+
+    def can_capture(self, color: Tuple[int, int, int]) -> bool:
+        """Whether ``color`` has a jump available, i.e. must capture this turn."""
+        return _can_jump(*self._sides(color))
 
     def get_valid_moves(self, piece: Piece) -> Dict[Tuple[int, int], List[Piece]]:
         moves: Dict[Tuple[int, int], List[Piece]] = {}
-        left, right = piece.col - 1, piece.col + 1
-        row = piece.row
+        red = self.red_men_bb | self.red_kings_bb
+        white = self.white_men_bb | self.white_kings_bb
+        opp = white if piece.color == RED else red
+        empty = ALL_SQUARES & ~(red | white)
+        dirs: Tuple[int, ...] = ()
         if piece.color == RED or piece.king:
-            moves.update(self._traverse_left(row + 1, ROWS, 1, piece.color, left))
-            moves.update(self._traverse_right(row + 1, ROWS, 1, piece.color, right))
+            dirs += FORWARD[0]
         if piece.color == WHITE or piece.king:
-            moves.update(self._traverse_left(row - 1, -1, -1, piece.color, left))
-            moves.update(self._traverse_right(row - 1, -1, -1, piece.color, right))
-        return moves
-
-    def _traverse_left(self, start, stop, step, color, left, skipped=None):
-        if skipped is None:
-            skipped = []
-        moves, last = {}, []
-        for r in range(start, stop, step):
-            if left < 0:
-                break
-            current = self.board[r][left]
-            if current == 0:
-                if skipped and not last:
-                    break
-                moves[(r, left)] = skipped + last
-                if last:
-                    moves.update(
-                        self._traverse_left(r + step, stop, step, color, left - 1, skipped + last)
-                    )
-                    moves.update(
-                        self._traverse_right(r + step, stop, step, color, left + 1, skipped + last)
-                    )
-                break
-            elif current.color == color:
-                break
-            else:
-                if last:
-                    break
-                last = [current]
-            left -= 1
-        return moves
+            dirs += FORWARD[1]
 
-    def _traverse_right(self, start, stop, step, color, right, skipped=None):
-        if skipped is None:
-            skipped = []
-        moves, last = {}, []
-        for r in range(start, stop, step):
-            if right >= COLS:
-                break
-            current = self.board[r][right]
-            if current == 0:
-                if skipped and not last:
-                    break
-                moves[(r, right)] = skipped + last
-                if last:
-                    moves.update(
-                        self._traverse_left(r + step, stop, step, color, right - 1, skipped + last)
-                    )
-                    moves.update(
-                        self._traverse_right(r + step, stop, step, color, right + 1, skipped + last)
-                    )
-                break
-            elif current.color == color:
-                break
-            else:
-                if last:
-                    break
-                last = [current]
-            right += 1
+        # Depth-first walk over (square, direction, pieces jumped so far). Items are pushed in
+        # reverse so they pop in the order a recursive walk would visit them.
+        neighbors, jumps, squares = NEIGHBORS, JUMPS, SQUARES
+        start = SQUARE_INDEX[piece.row][piece.col]
+        work = [(start, d, []) for d in reversed(dirs)]
+        while work:
+            sq, d, skipped = work.pop()
+            over = neighbors[sq][d]
+            if over < 0:
+                continue
+            if empty >> over & 1:
+                if not skipped:
+                    moves[squares[over]] = []
+                continue
+            if not opp >> over & 1:
+                continue
+            land = jumps[sq][d]
+            if land < 0 or not empty >> land & 1:
+                continue
+            jumped = skipped + [self._piece_at(over)]
+            moves[squares[land]] = jumped
+            # Multi-jumps continue in the same vertical direction, like the old grid walk.
+            group = d & 2
+            work.append((land, group + 1, jumped))
+            work.append((land, group, jumped))
         return moves
 
     def draw(self, win):  # type: ignore[no-self]
@@ -202,8 +378,5 @@ class Board:
                 pygame.draw.rect(
                     win, color, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
                 )
-        for row in range(ROWS):
-            for col in range(COLS):
-                piece = self.board[row][col]
-                if piece != 0:
-                    piece.draw(win)
+        for piece in self.get_all_pieces(RED) + self.get_all_pieces(WHITE):
+            piece.draw(win)
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import math, random, time 
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
 
-from checkers import Board, WHITE, RED
+from checkers import (
+    Board, WHITE, RED, NUM_SQUARES, ALL_SQUARES, RED_KING_ROW, WHITE_KING_ROW, NEIGHBORS, JUMPS, jit, njit,
+)
 from minimax import get_all_moves
 
 C_PUCT = 1.4    
 ROLLOUT_LIMIT = 60 
+ROLLOUT_GREEDY = 0.25  # chance a rollout ply plays the best-material move instead of a random one
 
 class Node:
     __slots__ = ("board", "color", "parent", "children", "N", "W")
@@ -20,18 +24,20 @@ class Node:
         self.N = 0
         self.W = 0.0
 
-    @property
-    def Q(self) -> float:
-        return self.W / self.N if self.N else 0.0
-
 
 def uct_select(node: Node) -> Node:
-    log_N = math.log(node.N + 1)  # +1 avoids log(0)
-    def ucb(n: Node):
-        if n.N == 0:
-            return float("inf")
-        return n.Q + C_PUCT * math.sqrt(log_N / n.N)
-    return max(node.children, key=ucb)
+    # UCB1 inlined over the children; unvisited children are taken first.
+    sqrt = math.sqrt
+    c_sqrt_log_N = C_PUCT * sqrt(math.log(node.N + 1))  # +1 avoids log(0)
+    best, best_ucb = None, float("-inf")
+    for n in node.children:
+        N = n.N
+        if N == 0:
+            return n
+        ucb = n.W / N + c_sqrt_log_N / sqrt(N)
+        if ucb > best_ucb:
+            best, best_ucb = n, ucb
+    return best
 
 
 def expand(node: Node):
@@ -40,20 +46,159 @@ def expand(node: Node):
         node.children.append(child)
 
 
-def rollout(board: Board, color) -> float:
-    turn, ply = color, 0
-    b = board.copy()
-    while ply < ROLLOUT_LIMIT and not b.winner():
-        moves = get_all_moves(b, turn)
-        if not moves:
+# Rollouts run on the raw bitboards so they can go through checkers.jit.
+RED_WINS, WHITE_WINS, DRAW = 0, 1, 2
+_NEIGHBORS = tuple(NEIGHBORS)
+_JUMPS = tuple(JUMPS)
+
+
+@jit
+def seed_rollouts(seed: int):
+    # Numba keeps its own generator, so it has to be seeded from compiled code.
+    random.seed(seed)
+
+
+@jit
+def popcount(bb: int) -> int:
+    count = 0
+    while bb:
+        bb &= bb - 1
+        count += 1
+    return count
+
+
+@jit
+def side_moves(men: int, kings: int, opp: int, empty: int, men_dirs: int):
+    """Legal moves as (src, dst, captured_bits) for one side, captures only if any exist,
+    one per piece and landing square as in Board.get_valid_moves.
+    ``men_dirs`` is the first of the two DIRECTIONS indices the side's men move along."""
+    quiets = []
+    captures = []
+    pieces = men | kings
+    neighbors, jumps = _NEIGHBORS, _JUMPS
+    for sq in range(NUM_SQUARES):
+        if not pieces >> sq & 1:
+            continue
+        first, last = men_dirs, men_dirs + 2
+        if kings >> sq & 1:
+            first, last = 0, 4
+        for d in range(first, last):
+            step = neighbors[sq][d]
+            if step >= 0 and empty >> step & 1:
+                quiets.append((sq, step, 0))
+        # Jump chains stay in the vertical direction they started in and are walked in
+        # Board.get_valid_moves order; a landing square reached twice keeps its first
+        # position and its last chain, as there
+        base = len(captures)
+        stack = [(sq, d, 0) for d in range(last - 1, first - 1, -1)]
+        while stack:
+            pos, d, captured = stack.pop()
+            over, land = neighbors[pos][d], jumps[pos][d]
+            if land < 0 or not opp >> over & 1 or not empty >> land & 1:
+                continue
+            captured |= 1 << over
+            for i in range(base, len(captures)):
+                if captures[i][1] == land:
+                    captures[i] = (sq, land, captured)
+                    break
+            else:
+                captures.append((sq, land, captured))
+            group = d & 2
+            stack.append((land, group + 1, captured))
+            stack.append((land, group, captured))
+    return captures if captures else quiets
+
+
+@jit
+def winner_bits(red_men: int, red_kings: int, white_men: int, white_kings: int) -> int:
+    """Same rules as Board.winner, returning RED_WINS/WHITE_WINS, or DRAW when undecided."""
+    red, white = red_men | red_kings, white_men | white_kings
+    empty = ALL_SQUARES & ~(red | white)
+    if red == 0:
+        return WHITE_WINS
+    if white == 0:
+        return RED_WINS
+    if len(side_moves(red_men, red_kings, white, empty, 0)) == 0:
+        return WHITE_WINS
+    if len(side_moves(white_men, white_kings, red, empty, 2)) == 0:
+        return RED_WINS
+    return DRAW
+
+
+@jit
+def rollout_bits(red_men: int, red_kings: int, white_men: int, white_kings: int,
+                 white_to_move: bool, limit: int, greedy: float) -> int:
+    """Random playout of at most ``limit`` plies; returns RED_WINS, WHITE_WINS or DRAW.
+
+    With probability ``greedy`` a ply picks among the moves winning the most material
+    (captured kings count double, crowning counts one) instead of any move.
+    """
+    if winner_bits(red_men, red_kings, white_men, white_kings) != DRAW:
+        return winner_bits(red_men, red_kings, white_men, white_kings)
+    for _ in range(limit):
+        if white_to_move:
+            men, kings, opp_men, opp_kings, men_dirs, king_row = (
+                white_men, white_kings, red_men, red_kings, 2, WHITE_KING_ROW)
+        else:
+            men, kings, opp_men, opp_kings, men_dirs, king_row = (
+                red_men, red_kings, white_men, white_kings, 0, RED_KING_ROW)
+        empty = ALL_SQUARES & ~(men | kings | opp_men | opp_kings)
+        moves = side_moves(men, kings, opp_men | opp_kings, empty, men_dirs)
+        if len(moves) == 0:
             break
-        b = random.choice(moves)
-        turn = WHITE if turn == RED else RED
-        ply += 1
-    winner = b.winner()
-    if winner == "White":
+
+        pick = random.randrange(len(moves))
+        if len(moves) > 1 and random.random() < greedy:
+            best, ties = -1, 0
+            for i in range(len(moves)):
+                src, dst, captured = moves[i]
+                gain = popcount(captured & opp_men) + 2 * popcount(captured & opp_kings)
+                if men >> src & 1 and king_row >> dst & 1:
+                    gain += 1
+                # Reservoir sampling keeps a uniform pick among the best moves
+                if gain > best:
+                    best, ties, pick = gain, 1, i
+                elif gain == best:
+                    ties += 1
+                    if random.randrange(ties) == 0:
+                        pick = i
+        src, dst, captured = moves[pick]
+
+        src_bit, dst_bit = 1 << src, 1 << dst
+        if kings & src_bit:
+            kings ^= src_bit | dst_bit
+        elif king_row & dst_bit:
+            men ^= src_bit
+            kings |= dst_bit
+        else:
+            men ^= src_bit | dst_bit
+        opp_men &= ~captured
+        opp_kings &= ~captured
+
+        if white_to_move:
+            white_men, white_kings, red_men, red_kings = men, kings, opp_men, opp_kings
+        else:
+            red_men, red_kings, white_men, white_kings = men, kings, opp_men, opp_kings
+        white_to_move = not white_to_move
+    return winner_bits(red_men, red_kings, white_men, white_kings)
+
+
+if njit is not None:
+    # Compile the rollout kernels (or load them from Numba's cache) at import rather than in
+    # the first search's time budget; from a cold cache that takes several seconds. A zero
+    # ply limit compiles everything without drawing from the rollout generator.
+    _start = Board()
+    rollout_bits(_start.red_men_bb, _start.red_kings_bb, _start.white_men_bb, _start.white_kings_bb,
+                 False, 0, ROLLOUT_GREEDY)
+    del _start
+
+
+def rollout(board: Board, color) -> float:
+    result = rollout_bits(board.red_men_bb, board.red_kings_bb, board.white_men_bb, board.white_kings_bb,
+                          color == WHITE, ROLLOUT_LIMIT, ROLLOUT_GREEDY)
+    if result == WHITE_WINS:
         return 1.0
-    if winner == "Red":
+    if result == RED_WINS:
         return 0.0
     return 0.5  # draw
 
@@ -65,25 +210,14 @@ def backpropagate(path: List[Node], value: float):
         value = 1.0 - value
 
 
-def best_move(board: Board, color, simulations: int = 800, time_limit: float = 5.0) -> Board:
-    """
-    Find the best move using MCTS with both simulation count and time limit.
-    
-    Args:
-        board: The current board state
-        color: The current player's color
-        simulations: Maximum number of simulations to run (default: 800)
-        time_limit: Maximum time in seconds to search (default: 5.0)
-    
-    Returns:
-        The selected best move (Board)
-    """
+def search(board: Board, color, simulations: int, time_limit: float) -> Tuple[Node, int]:
+    """Run MCTS from ``board`` and return the root node and the number of simulations done."""
     root = Node(board, color)
     expand(root)
     
     # No valid moves available
     if not root.children:
-        return board
+        return root, 0
         
     # Record start time for time limit enforcement
     start_time = time.time()
@@ -112,12 +246,63 @@ def best_move(board: Board, color, simulations: int = 800, time_limit: float = 5
         backpropagate(path, value)
         
         sim_count += 1
+
+    return root, sim_count
+
+
+def root_visits(board: Board, color, simulations: int, time_limit: float, seed: int) -> Tuple[Dict[int, int], int]:
+    """Worker for root parallelization: visit counts per child, keyed by the child's Zobrist key."""
+    random.seed(seed)
+    seed_rollouts(seed)
+    root, sim_count = search(board, color, simulations, time_limit)
+    return {child.board.zkey: child.N for child in root.children}, sim_count
+
+
+def best_move(board: Board, color, simulations: int = 800, time_limit: float = 5.0, workers: int = 1) -> Board:
+    """
+    Find the best move using MCTS with both simulation count and time limit.
     
-    # Select the child with the most visits as the best move
-    best_child = max(root.children, key=lambda n: n.N)
+    Args:
+        board: The current board state
+        color: The current player's color
+        simulations: Maximum number of simulations to run (default: 800)
+        time_limit: Maximum time in seconds to search (default: 5.0)
+        workers: Number of processes searching independent trees whose root
+            visit counts are summed (default: 1, search in this process)
+    
+    Returns:
+        The selected best move (Board)
+    """
+    start_time = time.time()
+
+    if workers > 1:
+        children = get_all_moves(board, color)
+        if not children:
+            return board
+        per_worker = max(1, simulations // workers)
+        visits: Dict[int, int] = {}
+        sim_count = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(root_visits, board, color, per_worker, time_limit, random.getrandbits(32))
+                for _ in range(workers)
+            ]
+            for future in futures:
+                counts, done = future.result()
+                sim_count += done
+                for key, n in counts.items():
+                    visits[key] = visits.get(key, 0) + n
+        # Select the child with the most visits summed over all trees
+        best_board = max(children, key=lambda b: visits.get(b.zkey, 0))
+    else:
+        root, sim_count = search(board, color, simulations, time_limit)
+        if not root.children:
+            return board
+        # Select the child with the most visits as the best move
+        best_board = max(root.children, key=lambda n: n.N).board
     
     # Optional debug info
     elapsed = time.time() - start_time
     print(f"MCTS completed {sim_count} simulations in {elapsed:.2f} seconds")
     
-    return best_child.board
+    return best_board
@@ -1,34 +1,36 @@
 from __future__ import annotations
 
-import copy
-from typing import List, Tuple, Dict
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple, Dict
 import math
 import time
-import zlib
 
-from checkers import Board, WHITE, RED
+from checkers import (
+    Board, WHITE, RED, NUM_SQUARES, ALL_SQUARES, RED_KING_ROW, WHITE_KING_ROW,
+    NEIGHBORS, JUMPS, FORWARD, ZOBRIST_RED_TO_MOVE, iter_bits,
+)
+from eval_nb import endgame_eval
 
 PIECE_VALUE = 1.0
 KING_VALUE = 2.5 
-POSITION_WEIGHTS = [
-    [0, 1, 0, 1, 0, 1, 0, 1],
-    [1, 0, 2, 0, 2, 0, 1, 0],
-    [0, 2, 0, 3, 0, 2, 0, 1],
-    [2, 0, 3, 0, 3, 0, 2, 0],
-    [0, 3, 0, 4, 0, 3, 0, 2],
-    [3, 0, 4, 0, 4, 0, 3, 0],
-    [0, 5, 0, 6, 0, 5, 0, 4],
-    [7, 0, 7, 0, 7, 0, 7, 0] 
-]
+PSQT_WEIGHT = 0.05  # score per POSITION_WEIGHTS point of advancement
 EXACT = 0
 LOWERBOUND = 1
 UPPERBOUND = 2
+ASPIRATION_WINDOW = 0.5
+NULL_MOVE_R = 2  # depth reduction for the null-move search
+KING_DIRS = FORWARD[0] + FORWARD[1]
 
 
-def evaluate_board(board: Board) -> float:
-    """Evaluate the board position from WHITE's perspective with improved heuristics."""
+def evaluate_board(board: Board, winner=...) -> float:
+    """Evaluate the board position from WHITE's perspective with improved heuristics.
+
+    ``winner`` is board.winner() when the caller already has it (None included).
+    """
     # 1. First priority - detect winning positions
-    winner = board.winner()
+    if winner is ...:
+        winner = board.winner()
     if winner == "White":
         return float("inf")
     if winner == "Red":
@@ -39,227 +41,333 @@ def evaluate_board(board: Board) -> float:
     red_material = board.red_left * PIECE_VALUE + board.red_kings * KING_VALUE
     material_score = white_material - red_material
 
-    white_pieces = board.get_all_pieces(WHITE)
-    red_pieces = board.get_all_pieces(RED)
-    white_kings = [p for p in white_pieces if p.king]
-    red_kings = [p for p in red_pieces if p.king]
-    
     # Track and punish position repetition
-    board_str = board_to_string(board)
-    repetition_count = position_history.get(board_str, 0)
+    repetition_count = position_history[board.zkey & HISTORY_MASK]
     repetition_penalty = repetition_count * 2.0
     
-    # Endgame pursuit logic
-    endgame_score = 0
+    # Endgame pursuit logic and the kings-only special case, computed by the eval_nb kernel
+    endgame_score = 0.0
     is_endgame = (board.white_left + board.red_left) <= 10
+    kings_only = (board.white_kings > 0 and board.white_left == board.white_kings
+                  and board.red_kings > 0 and board.red_left == board.red_kings)
+    if is_endgame or kings_only:
+        endgame_score = endgame_eval(
+            is_endgame, kings_only,
+            board.white_men_bb | board.white_kings_bb, board.white_kings_bb,
+            board.red_men_bb | board.red_kings_bb, board.red_kings_bb,
+            board.white_left, board.red_left, white_material, red_material,
+        )
     
-    if is_endgame:
-        # Center control incentive
-        white_centrality = sum(7 - (abs(k.row-3.5) + abs(k.col-3.5)) for k in white_kings) / len(white_kings) if white_kings else 0
-        red_centrality = sum(7 - (abs(k.row-3.5) + abs(k.col-3.5)) for k in red_kings) / len(red_kings) if red_kings else 0
-        endgame_score += 0.2 * (red_centrality - white_centrality)
-        
-        # Pursue enemy pieces when ahead in material
-        if white_material > red_material:
-            material_advantage = white_material - red_material
-            
-            total_distance = 0
-            min_distance = float('inf')
-            for wp in white_pieces:
-                piece_min_distance = float('inf')
-                for rp in red_pieces:
-                    distance = abs(wp.row - rp.row) + abs(wp.col - rp.col)
-                    piece_min_distance = min(piece_min_distance, distance)
-                    total_distance += distance
-                min_distance = min(min_distance, piece_min_distance)
-            
-            endgame_score -= min_distance * material_advantage
-            
-            # Penalize total distance to encourage all pieces to pursue
-            avg_distance = total_distance / (len(white_pieces) * len(red_pieces)) if red_pieces and white_pieces else 0
-            endgame_score -= avg_distance * 0.5 * material_advantage
-            
-            # We give a huge inceptive for capturing a piece in the late game
-            endgame_score += 5.0 * material_advantage * (12 - board.red_left)
-        
-        elif red_material > white_material:
-            material_advantage = red_material - white_material
-            
-            total_distance = 0
-            min_distance = float('inf')
-            for rp in red_pieces:
-                piece_min_distance = float('inf')
-                for wp in white_pieces:
-                    distance = abs(rp.row - wp.row) + abs(rp.col - wp.col)
-                    piece_min_distance = min(piece_min_distance, distance)
-                    total_distance += distance
-                min_distance = min(min_distance, piece_min_distance)
-            
-            endgame_score += min_distance * material_advantage
-            
-            avg_distance = total_distance / (len(white_pieces) * len(red_pieces)) if red_pieces and white_pieces else 0
-            endgame_score += avg_distance * 0.5 * material_advantage
-        
-            endgame_score -= 5.0 * material_advantage * (12 - board.white_left)
-        
-        # Additional tempo consideration - punish moves that don't make progress
-        remaining_pieces = board.white_left + board.red_left
-        if remaining_pieces < 6:
-            aggression_multiplier = (8 - remaining_pieces) * 2.0
-            endgame_score *= (1.0 + aggression_multiplier)
-    
-    # Special case for kings-only endgames
-    if board.white_kings > 0 and board.white_left == board.white_kings and board.red_kings > 0 and board.red_left == board.red_kings:
-        # Centralization of the kigs
-        white_kings = [p for p in board.get_all_pieces(WHITE) if p.king]
-        red_kings = [p for p in board.get_all_pieces(RED) if p.king]
-        
-        white_centrality = sum(7 - (abs(k.row-3.5) + abs(k.col-3.5)) for k in white_kings) / len(white_kings) if white_kings else 0
-        red_centrality = sum(7 - (abs(k.row-3.5) + abs(k.col-3.5)) for k in red_kings) / len(red_kings) if red_kings else 0
-        
-        # Add strong centralization bonus in king vs king endgames
-        endgame_score += (white_centrality - red_centrality) * 3.0
-        
-        # Distance between kings
-        min_king_distance = float('inf')
-        for wk in white_kings:
-            for rk in red_kings:
-                distance = abs(wk.row - rk.row) + abs(wk.col - rk.col)
-                min_king_distance = min(min_king_distance, distance)
-        
-        # White wants to minimize distance in king endgames (hunt down red kings)
-        if len(white_kings) >= len(red_kings):
-            endgame_score -= min_king_distance * 2.0
-        else:
-            endgame_score += min_king_distance * 2.0
+    # Reward advancing men, from the running piece-square totals kept by the board
+    position_score = PSQT_WEIGHT * (board.white_psqt - board.red_psqt)
     
     # Final weighted score
-    final_score = material_score + endgame_score - repetition_penalty
+    final_score = material_score + position_score + endgame_score - repetition_penalty
     
     return final_score
 
-def simulate_move(board: Board, piece, move: Tuple[int, int], skips):
+# A move is (src, dst, captured): the square index of the moving piece, the square it
+# lands on and the squares of the pieces it jumps.
+Move = Tuple[int, int, Tuple[int, ...]]
+
+def move_key(move: Move) -> int:
+    """Small int identifying a move within its position (a piece has one move per landing square)."""
+    return move[0] * NUM_SQUARES + move[1]
+
+def apply_move(board: Board, move: Move) -> Board:
     new_board = board.copy()
-    new_piece = new_board.get_piece(piece.row, piece.col)
-    new_board.move(new_piece, move[0], move[1])
-    if skips:
-        new_board.remove([new_board.get_piece(p.row, p.col) for p in skips])
+    new_board.move_square(move[0], move[1])
+    for sq in move[2]:
+        new_board.remove_square(sq)
     return new_board
 
-def get_all_moves(board: Board, color) -> List[Board]:
-    """Get all possible moves, enforcing mandatory captures."""
-    all_pieces = board.get_all_pieces(color)
-    all_moves = []
+def generate_moves(board: Board, color) -> List[Move]:
+    """Get all legal moves, enforcing mandatory captures.
+
+    Moves come back ordered for alpha-beta: longer capture chains first (the
+    checkers take on MVV-LVA), then moves that crown a king, then the rest.
+    Works straight off the bitboards and yields the same moves as
+    Board.get_valid_moves, without building Piece objects.
+    """
+    if color == RED:
+        men, kings, king_row, men_dirs = board.red_men_bb, board.red_kings_bb, RED_KING_ROW, FORWARD[0]
+        opp = board.white_men_bb | board.white_kings_bb
+    else:
+        men, kings, king_row, men_dirs = board.white_men_bb, board.white_kings_bb, WHITE_KING_ROW, FORWARD[1]
+        opp = board.red_men_bb | board.red_kings_bb
+    empty = ALL_SQUARES & ~(men | kings | opp)
     capture_moves = []
+    promotions = []
+    quiet_moves = []
     
-    for piece in all_pieces:
-        valid_moves = board.get_valid_moves(piece)
-        for move, skipped in valid_moves.items():
-            if skipped:
-                capture_moves.append(simulate_move(board, piece, move, skipped))
+    neighbors, jumps = NEIGHBORS, JUMPS
+    
+    for src in iter_bits(men | kings):
+        king = kings >> src & 1
+        dirs = KING_DIRS if king else men_dirs
+        
+        # Jump chains, walked depth-first in get_valid_moves order. A landing square reached
+        # twice keeps its first position and its last chain, as the dict there does.
+        chains: Dict[int, Tuple[int, ...]] = {}
+        work = [(src, d, ()) for d in reversed(dirs)]
+        while work:
+            sq, d, jumped = work.pop()
+            land = jumps[sq][d]
+            if land < 0 or not empty >> land & 1:
+                continue
+            over = neighbors[sq][d]
+            if not opp >> over & 1:
+                continue
+            jumped += (over,)
+            chains[land] = jumped
+            # Multi-jumps continue in the same vertical direction
+            group = d & 2
+            work.append((land, group + 1, jumped))
+            work.append((land, group, jumped))
+        for dst, captured in chains.items():
+            capture_moves.append((len(captured), not king and king_row >> dst & 1, (src, dst, captured)))
+        
+        # Quiet moves are dropped once a capture shows up
+        if not capture_moves:
+            for d in dirs:
+                dst = neighbors[src][d]
+                if dst >= 0 and empty >> dst & 1:
+                    (promotions if not king and king_row >> dst & 1 else quiet_moves).append((src, dst, ()))
 
     if capture_moves:
-        return capture_moves
+        if len(capture_moves) > 1:
+            capture_moves.sort(key=lambda m: (m[0], m[1]), reverse=True)
+        return [move for _, _, move in capture_moves]
     
-    for piece in all_pieces:
-        valid_moves = board.get_valid_moves(piece)
-        for move, skipped in valid_moves.items():
-            all_moves.append(simulate_move(board, piece, move, skipped))
+    return promotions + quiet_moves
+
+def get_all_moves(board: Board, color) -> List[Board]:
+    """Boards after every legal move, in generate_moves order."""
+    return [apply_move(board, move) for move in generate_moves(board, color)]
+
+def tt_key(board: Board, color) -> int:
+    """Zobrist key of the position including the side to move."""
+    return board.zkey ^ ZOBRIST_RED_TO_MOVE if color == RED else board.zkey
+
+TIME_CHECK_INTERVAL = 1024  # must be a power of two
+# Nodes visited by the current best_move call (a list so it can be bumped in place)
+_node_counter = [0]
+
+# Fixed-size transposition table: TT_BUCKETS buckets of two slots, indexed by the low bits
+# of the key. Slot 0 of a bucket is depth-preferred, slot 1 is always replaced. Each field
+# is its own array column, 24 bytes a slot, so the 2 * TT_BUCKETS slots take 48 MB per
+# searching process. The best move is kept as its move_key (-1 when there is none) and a
+# mask of the captured squares. The columns are allocated by the first search (see
+# tt_allocate) and kept across moves.
+TT_BUCKETS = 1 << 20  # must be a power of two
+TT_MASK = TT_BUCKETS - 1
+tt_keys = array('Q')
+tt_depths = array('b')
+tt_types = array('b')
+tt_scores = array('d')
+tt_moves = array('h')
+tt_captured = array('I')
+
+def tt_allocate():
+    """Size the table columns, once per process; processes that never search skip it."""
+    global tt_keys, tt_depths, tt_types, tt_scores, tt_moves, tt_captured
+    if not tt_keys:
+        slots = 2 * TT_BUCKETS
+        tt_keys = array('Q', [0]) * slots
+        tt_depths = array('b', [0]) * slots
+        tt_types = array('b', [0]) * slots
+        tt_scores = array('d', [0.0]) * slots
+        tt_moves = array('h', [-1]) * slots
+        tt_captured = array('I', [0]) * slots
+
+def tt_probe(key: int) -> int:
+    """The slot holding ``key``, or -1."""
+    i = (key & TT_MASK) << 1
+    if tt_keys[i] == key:
+        return i
+    if tt_keys[i + 1] == key:
+        return i + 1
+    return -1
+
+def tt_best_move(slot: int) -> Optional[Move]:
+    """The best move stored in ``slot``, its captures in square order."""
+    key = tt_moves[slot]
+    if key < 0:
+        return None
+    return key // NUM_SQUARES, key % NUM_SQUARES, tuple(iter_bits(tt_captured[slot]))
+
+def tt_store(key: int, depth: int, node_type: int, score: float, best: Optional[Move]):
+    """Store an entry in the depth-preferred slot when it is at least as deep as what is
+    there (or the same position), otherwise in the always-replace slot."""
+    i = (key & TT_MASK) << 1
+    if tt_keys[i] != key and depth < tt_depths[i]:
+        i += 1
+    tt_keys[i] = key
+    tt_depths[i] = depth
+    tt_types[i] = node_type
+    tt_scores[i] = score
+    if best is None:
+        tt_moves[i] = -1
+    else:
+        tt_moves[i] = move_key(best)
+        captured = 0
+        for sq in best[2]:
+            captured |= 1 << sq
+        tt_captured[i] = captured
+
+# Quiet moves that caused a beta cutoff: the last two per remaining depth, and a
+# depth-squared weighted count per move_key. Both are reset by best_move, and killers
+# is grown by size_killers before a search indexes it.
+killers: List[List[int]] = []
+history = array('i', [0] * (NUM_SQUARES * NUM_SQUARES))
+
+def size_killers(depth: int):
+    """Make sure every remaining depth up to ``depth`` has a killer slot."""
+    while len(killers) <= depth:
+        killers.append([-1, -1])
+
+def record_cutoff(key: int, depth: int):
+    history[key] += depth * depth
+    slot = killers[depth]
+    if slot[0] != key:
+        slot[1], slot[0] = slot[0], key
+
+def quiescence(position: Board, color, start_time: float, time_limit: float,
+               alpha: float, beta: float) -> float:
+    """Score of ``position`` for ``color`` once pending capture sequences are played out.
+
+    Captures are mandatory, so there is no stand-pat: a side that can capture must, and
+    the evaluation is only taken once the side to move is quiet. Every capture removes
+    a piece, so the recursion always ends.
+    """
+    _node_counter[0] += 1
+    if not _node_counter[0] & (TIME_CHECK_INTERVAL - 1) and time.time() - start_time > time_limit * 0.95:
+        raise TimeoutError("Search time limit exceeded")
+    
+    winner = position.winner()
+    if winner:
+        return float("inf") if winner == ("White" if color == WHITE else "Red") else float("-inf")
+    if not position.can_capture(color):
+        score = evaluate_board(position, winner)
+        return score if color == WHITE else -score
     
-    return all_moves
+    opponent = RED if color == WHITE else WHITE
+    best_eval = float("-inf")
+    for move in generate_moves(position, color):
+        eval_score = -quiescence(apply_move(position, move), opponent, start_time, time_limit, -beta, -alpha)
+        if eval_score > best_eval:
+            best_eval = eval_score
+        alpha = max(alpha, best_eval)
+        if beta <= alpha:
+            break
+    return best_eval
 
-def zobrist_hash(board: Board) -> int:
-    board_str = board_to_string(board)
-    return zlib.adler32(board_str.encode())
+def ordered_moves(position: Board, color, depth: int, tt_move: Optional[Move]) -> Iterator[Move]:
+    """Moves in search order. The stored best move comes first and is yielded before the
+    rest are generated, so a cutoff on it skips move generation for the node.
 
-transposition_table = {}
+    Captures keep the generate_moves order; quiet moves are ordered by this depth's
+    killers, then by history score (the sort is stable so promotions still lead
+    among equals).
+    """
+    tt_move_key = -1
+    if tt_move is not None:
+        yield tt_move
+        tt_move_key = move_key(tt_move)
+    moves = generate_moves(position, color)
+    if not moves[0][2] and len(moves) > 1:
+        first, second = killers[depth]
+        scores = history
+        def order(move: Move):
+            key = move_key(move)
+            return key == first, key == second, scores[key]
+        moves.sort(key=order, reverse=True)
+    for move in moves:
+        if move_key(move) != tt_move_key:
+            yield move
 
 def minimax_with_timeout(position: Board, depth: int, maximizing_color, 
                          start_time: float, time_limit: float,
-                         alpha=float("-inf"), beta=float("inf")):
-    """Minimax search with transposition table and timeout checks"""
-    # Check if we've exceeded the time limit
-    if time.time() - start_time > time_limit * 0.95:  # 95% of time limit
+                         alpha=float("-inf"), beta=float("inf"), allow_null: bool = True) -> Tuple[float, int]:
+    """Negamax principal variation search with transposition table and timeout checks.
+
+    ``maximizing_color`` is the side to move and scores are from its point of view.
+    ``allow_null`` is False right after a null move so two are never played in a row.
+    Returns the score and the move_key of the best move, or -1 at leaves and terminal positions.
+    """
+    # Check if we've exceeded the time limit, reading the clock only every TIME_CHECK_INTERVAL nodes
+    _node_counter[0] += 1
+    if not _node_counter[0] & (TIME_CHECK_INTERVAL - 1) and time.time() - start_time > time_limit * 0.95:  # 95% of time limit
         raise TimeoutError("Search time limit exceeded")
     
     # Check if position is a terminal state
     winner = position.winner()
     if depth == 0 or winner:
-        if winner == "White":
-            return float("inf"), position
-        if winner == "Red":
-            return float("-inf"), position
-        return evaluate_board(position), position
-
-    # Generate unique hash for the board position
-    position_hash = zobrist_hash(position)
+        if winner:
+            return (float("inf") if winner == ("White" if maximizing_color == WHITE else "Red") else float("-inf")), -1
+        return quiescence(position, maximizing_color, start_time, time_limit, alpha, beta), -1
+
+    position_hash = tt_key(position, maximizing_color)
     
-    # Check transposition table
-    if position_hash in transposition_table:
-        tt_entry = transposition_table[position_hash]
-        if tt_entry['depth'] >= depth:
-            if tt_entry['node_type'] == EXACT:
-                return tt_entry['score'], tt_entry['best_board']
-            elif tt_entry['node_type'] == LOWERBOUND and tt_entry['score'] >= beta:
-                return tt_entry['score'], tt_entry['best_board']
-            elif tt_entry['node_type'] == UPPERBOUND and tt_entry['score'] <= alpha:
-                return tt_entry['score'], tt_entry['best_board']
+    # Check transposition table, using stored bounds to narrow the window
+    tt_slot = tt_probe(position_hash)
+    if tt_slot >= 0:
+        if tt_depths[tt_slot] >= depth:
+            tt_type, tt_score, tt_move_key = tt_types[tt_slot], tt_scores[tt_slot], tt_moves[tt_slot]
+            if tt_type == EXACT:
+                return tt_score, tt_move_key
+            if tt_type == LOWERBOUND:
+                alpha = max(alpha, tt_score)
+            elif tt_type == UPPERBOUND:
+                beta = min(beta, tt_score)
+            if alpha >= beta:
+                return tt_score, tt_move_key
+
+    # Store the searched window for node type determination
+    orig_alpha, orig_beta = alpha, beta
+
+    opponent = RED if maximizing_color == WHITE else WHITE
     
-    # Regular alpha-beta search if not found in table or insufficient depth
-    orig_alpha = alpha  # Store original alpha for node type determination
+    # Null-move pruning: if passing still fails high at reduced depth, so will a real move.
+    # Not when a capture is forced (passing would be illegal) nor in the endgame, where
+    # zugzwang makes passing worth more than any move.
+    if (allow_null and depth > NULL_MOVE_R and beta < math.inf and not position.can_capture(maximizing_color)
+            and position.white_left + position.red_left > 10):
+        null_score = -minimax_with_timeout(position, depth - 1 - NULL_MOVE_R, opponent, start_time, time_limit,
+                                           -beta, -math.nextafter(beta, -math.inf), False)[0]
+        if null_score >= beta:
+            return beta, -1
     
-    if maximizing_color == WHITE:
-        max_eval = float("-inf")
-        best_board = None
-        for child in get_all_moves(position, WHITE):
-            eval_score, _ = minimax_with_timeout(child, depth - 1, RED, start_time, time_limit, alpha, beta)
-            if eval_score > max_eval:
-                max_eval, best_board = eval_score, child
-            alpha = max(alpha, max_eval)
-            if beta <= alpha:
-                break
-        
-        # Determine node type and store in transposition table
-        node_type = EXACT
-        if max_eval <= orig_alpha:
-            node_type = UPPERBOUND
-        elif max_eval >= beta:
-            node_type = LOWERBOUND
-            
-        transposition_table[position_hash] = {
-            'score': max_eval,
-            'best_board': best_board,
-            'depth': depth,
-            'node_type': node_type
-        }
-        
-        return max_eval, best_board
-    else:
-        min_eval = float("inf")
-        best_board = None
-        for child in get_all_moves(position, RED):
-            eval_score, _ = minimax_with_timeout(child, depth - 1, WHITE, start_time, time_limit, alpha, beta)
-            if eval_score < min_eval:
-                min_eval, best_board = eval_score, child
-            beta = min(beta, min_eval)
-            if beta <= alpha:
-                break
-                
-        # Determine node type and store in transposition table
-        node_type = EXACT
-        if min_eval <= orig_alpha:
-            node_type = UPPERBOUND
-        elif min_eval >= beta:
-            node_type = LOWERBOUND
-            
-        transposition_table[position_hash] = {
-            'score': min_eval,
-            'best_board': best_board,
-            'depth': depth,
-            'node_type': node_type
-        }
-        
-        return min_eval, best_board
+    # The first move gets the full window; the rest are tried with a null window just
+    # above alpha and only re-searched when they turn out better
+    best_eval, best, best_move_key = float("-inf"), None, -1
+    tt_move = tt_best_move(tt_slot) if tt_slot >= 0 else None
+    for i, move in enumerate(ordered_moves(position, maximizing_color, depth, tt_move)):
+        child = apply_move(position, move)
+        if i == 0:
+            eval_score = -minimax_with_timeout(child, depth - 1, opponent, start_time, time_limit, -beta, -alpha)[0]
+        else:
+            eval_score = -minimax_with_timeout(child, depth - 1, opponent, start_time, time_limit,
+                                               -math.nextafter(alpha, math.inf), -alpha)[0]
+            if alpha < eval_score < beta:
+                eval_score = -minimax_with_timeout(child, depth - 1, opponent, start_time, time_limit, -beta, -alpha)[0]
+        if eval_score > best_eval:
+            best_eval, best, best_move_key = eval_score, move, move_key(move)
+        alpha = max(alpha, best_eval)
+        if beta <= alpha:
+            if not move[2]:
+                record_cutoff(move_key(move), depth)
+            break
+
+    # Determine node type and store in transposition table
+    node_type = EXACT
+    if best_eval <= orig_alpha:
+        node_type = UPPERBOUND
+    elif best_eval >= orig_beta:
+        node_type = LOWERBOUND
+    tt_store(position_hash, depth, node_type, best_eval, best)
+
+    return best_eval, best_move_key
     
 # increase depth in the late game to prevent draws
 def get_dynamic_depth(board: Board, base_depth: int) -> int:
@@ -276,28 +384,102 @@ def get_dynamic_depth(board: Board, base_depth: int) -> int:
     else:
         return base_depth
 
-position_history: Dict[str, int] = {}
-
-def board_to_string(board: Board) -> str:
-    """Convert a board to a string for position tracking."""
-    result = ""
-    for row in range(8):
-        for col in range(8):
-            piece = board.get_piece(row, col)
-            if piece == 0:
-                result += "0"
-            elif piece.color == WHITE:
-                result += "W" if not piece.king else "K"
-            else:
-                result += "R" if not piece.king else "Q"
-    return result
+# Number of times our search has played into a position, indexed by the low HISTORY_BITS
+# of its Zobrist key and saturating at 255. Positions sharing a slot share a count.
+HISTORY_BITS = 16
+HISTORY_MASK = (1 << HISTORY_BITS) - 1
+HISTORY_MAX_POSITIONS = 500
+position_history = array('B', bytes(1 << HISTORY_BITS))
+# Slots currently non-zero (a list so it can be bumped in place)
+_history_used = [0]
 
-def best_move(board: Board, depth: int, color, time_limit: float = 500.0) -> Board:
-    global position_history
-    
+# Root-split pool, started by the first best_move call with workers > 1 and kept alive so
+# each worker's transposition table, killers and history carry over from move to move
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """The shared split_root pool, restarted only when ``workers`` changes."""
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+def root_move_score(board: Board, move: Move, depth: int, color,
+                    start_time: float, time_limit: float, alpha: float) -> float:
+    """Score of ``move`` for ``color`` searched to ``depth``, with ``alpha`` as a lower bound.
+
+    Scores at or below ``alpha`` are only upper bounds. Also the worker task of split_root.
+    """
+    opponent = RED if color == WHITE else WHITE
+    return -minimax_with_timeout(apply_move(board, move), depth - 1, opponent,
+                                 start_time, time_limit, float("-inf"), -alpha)[0]
+
+def root_move_task(history_snapshot: bytes, board: Board, move: Move, depth: int, color,
+                   start_time: float, time_limit: float, alpha: float) -> float:
+    """Worker task of split_root: load the parent's position_history, then root_move_score."""
+    position_history[:] = array('B', history_snapshot)
+    tt_allocate()
+    size_killers(depth)
+    return root_move_score(board, move, depth, color, start_time, time_limit, alpha)
+
+def split_root(executor: ProcessPoolExecutor, board: Board, depth: int, color,
+               start_time: float, time_limit: float, first_key: int) -> Tuple[float, int]:
+    """Parallel root search: the first move (``first_key`` when it is legal) is searched here
+    to set alpha, then the remaining moves run on ``executor`` with that bound.
+
+    Each worker process keeps its own transposition table, killers and history; every
+    task brings a snapshot of this process's position_history.
+    """
+    if board.winner() is not None:
+        # Finished game: score it as the serial search does, with no move
+        return minimax_with_timeout(board, depth, color, start_time, time_limit)
+    moves = generate_moves(board, color)
+    moves.sort(key=lambda move: move_key(move) == first_key, reverse=True)
+    best_score, best_key = float("-inf"), -1
+    score = root_move_score(board, moves[0], depth, color, start_time, time_limit, best_score)
+    if score > best_score:
+        best_score, best_key = score, move_key(moves[0])
+    # Workers get this process's repetition counts, whatever the multiprocessing start method
+    history_snapshot = bytes(position_history)
+    futures = [
+        (move, executor.submit(root_move_task, history_snapshot, board, move, depth, color,
+                               start_time, time_limit, best_score))
+        for move in moves[1:]
+    ]
+    try:
+        for move, future in futures:
+            score = future.result()
+            if score > best_score:
+                best_score, best_key = score, move_key(move)
+    except TimeoutError:
+        for _, future in futures:
+            future.cancel()
+        raise
+    return best_score, best_key
+
+def best_move(board: Board, depth: int, color, time_limit: float = 500.0, workers: int = 1) -> Board:
+    """Iterative-deepening search for ``color``'s move; returns the board after it.
+
+    With ``workers`` > 1 each iteration splits the root moves over that many processes
+    (see split_root) with a full window, instead of running one aspiration-window search.
+    """
     start_time = time.time()
-    best_board = None
+    best_key = -1
+    prev_score = None
+    _node_counter[0] = 0
+    for slot in killers:
+        slot[0] = slot[1] = -1
+    # Iterations search to at most depth + 4 (see the loop below)
+    size_killers(depth + 4)
+    for i in range(len(history)):
+        history[i] = 0
+    tt_allocate()
     
+    executor = get_executor(workers) if workers > 1 else None
     # Start with iterative deepening from depth 1
     for current_depth in range(1, depth + 5):
         if time.time() - start_time > time_limit * 0.8:
@@ -307,25 +489,45 @@ def best_move(board: Board, depth: int, color, time_limit: float = 500.0) -> Boa
         actual_depth = min(current_depth, get_dynamic_depth(board, current_depth))
         
         try:
-            # Run minimax with a time check
-            _, new_board = minimax_with_timeout(board, actual_depth, color, start_time, time_limit)
-            if new_board is not None:
-                best_board = new_board
+            if executor is not None:
+                score, key = split_root(executor, board, actual_depth, color, start_time, time_limit, best_key)
+            else:
+                # Aspiration window around the previous iteration's score
+                alpha, beta = float("-inf"), float("inf")
+                if current_depth >= 3 and prev_score is not None and not math.isinf(prev_score):
+                    alpha, beta = prev_score - ASPIRATION_WINDOW, prev_score + ASPIRATION_WINDOW
+                
+                # Run minimax with a time check, widening the window on a fail-low/high
+                while True:
+                    score, key = minimax_with_timeout(board, actual_depth, color, start_time, time_limit, alpha, beta)
+                    if score <= alpha and alpha != float("-inf"):
+                        alpha = float("-inf")
+                    elif score >= beta and beta != float("inf"):
+                        beta = float("inf")
+                    else:
+                        break
+            prev_score = score
+            if key >= 0:
+                best_key = key
         except TimeoutError:
             break
     
     # Return the original board if no move found
-    if best_board is None:
+    if best_key < 0:
         return board
+    # Replay the chosen move to get the resulting board
+    best = next(move for move in generate_moves(board, color) if move_key(move) == best_key)
+    best_board = apply_move(board, best)
     
     # Track position for repetition detection
-    board_str = board_to_string(best_board)
-    position_history[board_str] = position_history.get(board_str, 0) + 1
+    slot = best_board.zkey & HISTORY_MASK
+    if not position_history[slot]:
+        _history_used[0] += 1
+    position_history[slot] = min(255, position_history[slot] + 1)
     
-    # Clean up history if it gets too large
-    if len(position_history) > 500:
-        keys = list(position_history.keys())
-        for key in keys[:250]:
-            position_history.pop(key)
+    # Clear the history in one go once it covers too many positions
+    if _history_used[0] > HISTORY_MAX_POSITIONS:
+        position_history[:] = array('B', bytes(len(position_history)))
+        _history_used[0] = 0
             
     return best_board
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import itertools, random, sys, time, argparse
-from typing import Dict, Callable, Tuple, Optional
+import itertools, os, random, sys, time, argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Callable, List, Tuple, Optional
 
 import pygame  # type: ignore
 
 from checkers import Board, RED, WHITE, ROWS, COLS, SQUARE_SIZE
 from minimax import best_move as minimax_move, get_all_moves
 from minimax_1 import best_move as minimax_move_1
-from mcts import best_move as mcts_move
+from mcts import best_move as mcts_move, seed_rollouts
 
 K_FACTOR = 25
 ROUNDS = 10
@@ -83,10 +84,29 @@ BOTS: Dict[str, Callable] = {
 }
 ratings: Dict[str, float] = {name: 1000.0 for name in BOTS}
 
+def play_bots(name_a: str, name_b: str, swap_colors: bool, seed: int):
+    """Pool task: one headless game between two registered bots, by name so it pickles."""
+    random.seed(seed)
+    seed_rollouts(seed)
+    return play_game(BOTS[name_a], BOTS[name_b], swap_colors=swap_colors, win=None)
+
+def report(name_a: str, name_b: str, swap_colors: bool, result: float):
+    """Apply the Elo update for one game and print it."""
+    old_rating_a, old_rating_b = ratings[name_a], ratings[name_b]
+    ratings[name_a], ratings[name_b] = rate(ratings[name_a], ratings[name_b], result)
+    
+    outcome = "win" if result == 1 else "draw" if result == 0.5 else "loss"
+    red, white = (name_b, name_a) if swap_colors else (name_a, name_b)
+    print(f"Game: {red}(RED) vs {white}(WHITE) - {name_a} {outcome}")
+    print(f"  {name_a}: {old_rating_a:.1f} → {ratings[name_a]:.1f} ({ratings[name_a]-old_rating_a:+.1f})")
+    print(f"  {name_b}: {old_rating_b:.1f} → {ratings[name_b]:.1f} ({ratings[name_b]-old_rating_b:+.1f})")
+
 def main():
     global VISUALIZE
     parser = argparse.ArgumentParser()
     parser.add_argument("--visual", action="store_true", help="Show Pygame board during games")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes playing games concurrently (ignored with --visual)")
     args = parser.parse_args()
     if args.visual:
         VISUALIZE = True
@@ -97,32 +117,30 @@ def main():
         win = pygame.display.set_mode((COLS * SQUARE_SIZE, ROWS * SQUARE_SIZE))
         pygame.display.set_caption("Checkers")
 
-    pairs = list(itertools.combinations(BOTS.items(), 2))
-    for rnd in range(ROUNDS):
-        print(f"\n--- Round {rnd+1}/{ROUNDS} ---")
+    # Every round plays each pair twice, A as RED (Game 1) then A as WHITE (Game 2)
+    pairs = list(itertools.combinations(BOTS, 2))
+    schedule: List[List[Tuple[str, str, bool]]] = []
+    for _ in range(ROUNDS):
         random.shuffle(pairs)
-        for (name_a, bot_a), (name_b, bot_b) in pairs:
-            # Game 1 (A = Red)
-            result = play_game(bot_a, bot_b, swap_colors=False, win=win)
-            old_rating_a, old_rating_b = ratings[name_a], ratings[name_b]
-            ratings[name_a], ratings[name_b] = rate(ratings[name_a], ratings[name_b], result)
-            
-            # Print Game 1 results
-            outcome = "win" if result == 1 else "draw" if result == 0.5 else "loss"
-            print(f"Game: {name_a}(RED) vs {name_b}(WHITE) - {name_a} {outcome}")
-            print(f"  {name_a}: {old_rating_a:.1f} → {ratings[name_a]:.1f} ({ratings[name_a]-old_rating_a:+.1f})")
-            print(f"  {name_b}: {old_rating_b:.1f} → {ratings[name_b]:.1f} ({ratings[name_b]-old_rating_b:+.1f})")
-            
-            # Game 2 (A = White)
-            result = play_game(bot_a, bot_b, swap_colors=True, win=win)
-            old_rating_a, old_rating_b = ratings[name_a], ratings[name_b]
-            ratings[name_a], ratings[name_b] = rate(ratings[name_a], ratings[name_b], result)
-            
-            # Print Game 2 results
-            outcome = "win" if result == 1 else "draw" if result == 0.5 else "loss"
-            print(f"Game: {name_b}(RED) vs {name_a}(WHITE) - {name_a} {outcome}")
-            print(f"  {name_a}: {old_rating_a:.1f} → {ratings[name_a]:.1f} ({ratings[name_a]-old_rating_a:+.1f})")
-            print(f"  {name_b}: {old_rating_b:.1f} → {ratings[name_b]:.1f} ({ratings[name_b]-old_rating_b:+.1f})")
+        schedule.append([(name_a, name_b, swap) for name_a, name_b in pairs for swap in (False, True)])
+
+    if win is not None or args.workers <= 1:
+        # Visual games share the window, so they stay serial and are rated as they finish
+        for rnd, games in enumerate(schedule):
+            print(f"\n--- Round {rnd+1}/{ROUNDS} ---")
+            for name_a, name_b, swap in games:
+                report(name_a, name_b, swap, play_game(BOTS[name_a], BOTS[name_b], swap_colors=swap, win=win))
+    else:
+        # Games are independent, so play them all at once and rate them afterwards in schedule order
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [
+                [executor.submit(play_bots, name_a, name_b, swap, random.getrandbits(32)) for name_a, name_b, swap in games]
+                for games in schedule
+            ]
+            for rnd, (games, results) in enumerate(zip(schedule, futures)):
+                print(f"\n--- Round {rnd+1}/{ROUNDS} ---")
+                for (name_a, name_b, swap), future in zip(games, results):
+                    report(name_a, name_b, swap, future.result())
 
     if win:
         pygame.quit()